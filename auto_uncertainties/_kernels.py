@@ -0,0 +1,199 @@
+"""
+Compiled kernels for the error propagation of `Uncertainty` arithmetic.
+
+Numba is an optional dependency. If it is not installed, every function in this
+module falls back to numexpr (also optional) for large arrays, and otherwise to
+the equivalent NumPy expression.
+
+Numba itself, and the kernels in `auto_uncertainties._numba_kernels`, are only
+imported on the first operation that uses them.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+from types import ModuleType
+
+import numpy as np
+
+try:
+    import numexpr
+except ImportError:  # pragma: no cover
+    numexpr = None
+
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+HAS_NUMEXPR = numexpr is not None
+
+# Below this many elements, launching the parallel Numba kernels costs more than
+# the temporaries of the NumPy expressions they replace.
+KERNEL_MIN_SIZE = 4096
+
+# Below this many elements, the overhead of numexpr outweighs the saved temporaries.
+NUMEXPR_MIN_SIZE = 10_000
+
+# Dtypes for which the kernels are compiled. These are native byte order, which
+# the compiled signatures require.
+KERNEL_DTYPES = (np.dtype(np.float64), np.dtype(np.float32))
+
+# Every fast-math flag except "nnan" and "ninf": the error propagation must keep
+# NaN / inf values intact, since `Uncertainty` relies on them for its own checks.
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+
+def use_kernels(*arrays) -> bool:
+    """Whether the compiled kernels can be applied to ``arrays``."""
+    if not HAS_NUMBA or not all(isinstance(a, np.ndarray) for a in arrays):
+        return False
+    first = arrays[0]
+    # The compiled signatures only accept writable arrays.
+    return (
+        first.size >= KERNEL_MIN_SIZE
+        and first.dtype in KERNEL_DTYPES
+        and all(
+            a.shape == first.shape and a.dtype == first.dtype and a.flags.writeable
+            for a in arrays
+        )
+    )
+
+
+@functools.cache
+def numba_kernels() -> ModuleType:
+    """Import (and thereby compile) the Numba kernels. Requires Numba."""
+    from auto_uncertainties import _numba_kernels
+
+    return _numba_kernels
+
+
+def use_numexpr(*arrays) -> bool:
+    """
+    Whether ``arrays`` should be evaluated with numexpr (when the kernels are not used).
+
+    numexpr has no float16 or long double, and would return the result with another
+    dtype, so only arrays that share one of ``KERNEL_DTYPES`` are accepted.
+    """
+    if not HAS_NUMEXPR or not all(isinstance(a, np.ndarray) for a in arrays):
+        return False
+    dtype = arrays[0].dtype
+    return (
+        dtype in KERNEL_DTYPES
+        and all(a.dtype == dtype for a in arrays)
+        and max(a.size for a in arrays) >= NUMEXPR_MIN_SIZE
+    )
+
+
+def _use_numpy(a, b) -> bool:
+    """Whether ``a`` and ``b`` are not both arrays, or too small for the other backends."""
+    if not isinstance(a, np.ndarray) or not isinstance(b, np.ndarray):
+        return True
+    return max(a.size, b.size) < min(KERNEL_MIN_SIZE, NUMEXPR_MIN_SIZE)
+
+
+def hypot2(a, b):
+    """
+    Compute ``sqrt(a**2 + b**2)``, i.e., the combined error of a sum or difference.
+
+    Large same-shape float64 or float32 arrays are handled in a single pass by
+    a compiled kernel, without allocating any temporaries. Large float arrays
+    of different (but broadcastable) shapes go through an equivalent compiled
+    ufunc. Without Numba, large float arrays are evaluated by numexpr.
+    Everything else uses NumPy.
+
+    :param a: Error of the first operand
+    :param b: Error of the second operand
+    """
+    # Scalars and small arrays (the most frequent cases) skip the checks for the
+    # other backends.
+    if _use_numpy(a, b):
+        return np.sqrt(a**2 + b**2)
+    if use_kernels(a, b):
+        return numba_kernels().hypot2(a.ravel(), b.ravel()).reshape(a.shape)
+    if (
+        HAS_NUMBA
+        and a.dtype == b.dtype
+        and a.dtype.type in (np.float32, np.float64)
+        and max(a.size, b.size) >= KERNEL_MIN_SIZE
+    ):
+        return numba_kernels().hypot_ufunc()(a, b)
+    if use_numexpr(a, b):
+        return numexpr.evaluate("sqrt(a * a + b * b)", local_dict={"a": a, "b": b})
+    return np.sqrt(a**2 + b**2)
+
+
+def mul_err(an, ae, bn, be):
+    """
+    Compute the error of the product ``a * b``.
+
+    :param an: Central value of the first operand
+    :param ae: Error of the first operand
+    :param bn: Central value of the second operand
+    :param be: Error of the second operand
+    """
+    if _use_numpy(an, bn):
+        return np.sqrt((bn * ae) ** 2 + (an * be) ** 2)
+    if use_kernels(an, ae, bn, be):
+        kernel = numba_kernels().mul_err
+        return kernel(an.ravel(), ae.ravel(), bn.ravel(), be.ravel()).reshape(an.shape)
+    if use_numexpr(an, ae, bn, be):
+        return numexpr.evaluate(
+            "sqrt((bn * ae) ** 2 + (an * be) ** 2)",
+            local_dict={"an": an, "ae": ae, "bn": bn, "be": be},
+        )
+    return np.sqrt((bn * ae) ** 2 + (an * be) ** 2)
+
+
+def div_err(an, ae, bn, be):
+    """
+    Compute the error of the quotient ``a / b``.
+
+    :param an: Central value of the numerator
+    :param ae: Error of the numerator
+    :param bn: Central value of the denominator
+    :param be: Error of the denominator
+    """
+    if _use_numpy(an, bn):
+        return np.sqrt((ae / bn) ** 2 + (an * be / bn**2) ** 2)
+    if use_kernels(an, ae, bn, be):
+        kernel = numba_kernels().div_err
+        return kernel(an.ravel(), ae.ravel(), bn.ravel(), be.ravel()).reshape(an.shape)
+    if use_numexpr(an, ae, bn, be):
+        return numexpr.evaluate(
+            "sqrt((ae / bn) ** 2 + (an * be / bn**2) ** 2)",
+            local_dict={"an": an, "ae": ae, "bn": bn, "be": be},
+        )
+    return np.sqrt((ae / bn) ** 2 + (an * be / bn**2) ** 2)
+
+
+def stacked_op(op, a, b):
+    """
+    Apply an arithmetic operation to two stacked ``(2, ...)`` arrays, where
+    ``a[0]`` holds the central values and ``a[1]`` the errors.
+
+    Both arrays must satisfy `use_kernels`.
+
+    :param op: One of `operator.add`, `operator.sub`, `operator.mul` or `operator.truediv`
+    :param a: Stacked central values and errors of the first operand
+    :param b: Stacked central values and errors of the second operand
+
+    :return: The stacked central values and errors of the result
+    """
+    kernel = numba_kernels().STACKED_KERNELS[op]
+    return kernel(a.reshape(2, -1), b.reshape(2, -1)).reshape(a.shape)
+
+
+def pow_stacked(xn, xe, p):
+    """
+    Compute ``x ** p`` and its error for a constant real exponent ``p``.
+
+    The error is ``|p * x ** (p - 1)| * dx``, computed in the same pass as the power.
+    ``xn`` and ``xe`` must satisfy `use_kernels`.
+
+    :param xn: Central values of the base
+    :param xe: Errors of the base
+    :param p: The exponent
+
+    :return: The stacked ``(2, ...)`` central values and errors of the result
+    """
+    # A float exponent uses IEEE pow, where 0.0 ** -1 is inf. Numba's integer power would raise.
+    p = xn.dtype.type(p)
+    return numba_kernels().pow_stacked(xn.ravel(), xe.ravel(), p).reshape(2, *xn.shape)
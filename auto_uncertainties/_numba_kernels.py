@@ -0,0 +1,202 @@
+"""
+Numba implementation of the kernels in `auto_uncertainties._kernels`.
+
+Importing this module imports Numba and compiles (or loads from the on-disk
+cache) every kernel for its explicit signatures. `auto_uncertainties._kernels`
+therefore only imports it on the first operation that uses the kernels.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import operator
+
+import numba
+import numba.experimental
+import numpy as np
+
+from auto_uncertainties._kernels import _FASTMATH
+
+
+def _signatures(template: str) -> list[str]:
+    return [template.format(t=t) for t in ("f8", "f4")]
+
+
+# The kernels are compiled for these signatures when this module is imported (and
+# cached on disk), so later sessions only load them.
+# Each dtype in _kernels.KERNEL_DTYPES gets its own specialization, which Numba
+# selects from the argument types.
+_SIG_1D_2 = _signatures("{t}[::1]({t}[::1], {t}[::1])")
+_SIG_1D_4 = _signatures("{t}[::1]({t}[::1], {t}[::1], {t}[::1], {t}[::1])")
+_SIG_STACKED = _signatures("{t}[:, ::1]({t}[:, ::1], {t}[:, ::1])")
+_SIG_POW = _signatures("{t}[:, ::1]({t}[::1], {t}[::1], {t})")
+
+
+@numba.njit(inline="always")
+def _hypot(x, y):
+    return math.sqrt(x * x + y * y)
+
+
+@numba.njit(inline="always")
+def _mul_err_1(an, ae, bn, be):
+    return _hypot(ae * bn, be * an)
+
+
+@numba.njit(inline="always")
+def _div_err_1(an, ae, bn, be):
+    return _hypot(ae / bn, an * be / (bn * bn))
+
+
+@numba.njit(
+    _SIG_1D_2, parallel=True, fastmath=_FASTMATH, error_model="numpy", cache=True
+)
+def hypot2(a, b):
+    out = np.empty_like(a)
+    for i in numba.prange(a.size):
+        out[i] = _hypot(a[i], b[i])
+    return out
+
+
+@numba.njit(
+    _SIG_1D_4, parallel=True, fastmath=_FASTMATH, error_model="numpy", cache=True
+)
+def mul_err(an, ae, bn, be):
+    out = np.empty_like(an)
+    for i in numba.prange(an.size):
+        out[i] = _mul_err_1(an[i], ae[i], bn[i], be[i])
+    return out
+
+
+@numba.njit(
+    _SIG_1D_4, parallel=True, fastmath=_FASTMATH, error_model="numpy", cache=True
+)
+def div_err(an, ae, bn, be):
+    out = np.empty_like(an)
+    for i in numba.prange(an.size):
+        out[i] = _div_err_1(an[i], ae[i], bn[i], be[i])
+    return out
+
+
+# Kernels on stacked (2, N) arrays, where row 0 holds the central values and
+# row 1 the errors. Both rows of the result are written in the same iteration.
+@numba.njit(
+    _SIG_STACKED, parallel=True, fastmath=_FASTMATH, error_model="numpy", cache=True
+)
+def add_stacked(a, b):
+    out = np.empty_like(a)
+    for i in numba.prange(a.shape[1]):
+        out[0, i] = a[0, i] + b[0, i]
+        out[1, i] = _hypot(a[1, i], b[1, i])
+    return out
+
+
+@numba.njit(
+    _SIG_STACKED, parallel=True, fastmath=_FASTMATH, error_model="numpy", cache=True
+)
+def sub_stacked(a, b):
+    out = np.empty_like(a)
+    for i in numba.prange(a.shape[1]):
+        out[0, i] = a[0, i] - b[0, i]
+        out[1, i] = _hypot(a[1, i], b[1, i])
+    return out
+
+
+@numba.njit(
+    _SIG_STACKED, parallel=True, fastmath=_FASTMATH, error_model="numpy", cache=True
+)
+def mul_stacked(a, b):
+    out = np.empty_like(a)
+    for i in numba.prange(a.shape[1]):
+        out[0, i] = a[0, i] * b[0, i]
+        out[1, i] = _mul_err_1(a[0, i], a[1, i], b[0, i], b[1, i])
+    return out
+
+
+@numba.njit(
+    _SIG_STACKED, parallel=True, fastmath=_FASTMATH, error_model="numpy", cache=True
+)
+def div_stacked(a, b):
+    out = np.empty_like(a)
+    for i in numba.prange(a.shape[1]):
+        out[0, i] = a[0, i] / b[0, i]
+        out[1, i] = _div_err_1(a[0, i], a[1, i], b[0, i], b[1, i])
+    return out
+
+
+@numba.njit(
+    _SIG_POW, parallel=True, fastmath=_FASTMATH, error_model="numpy", cache=True
+)
+def pow_stacked(xn, xe, p):
+    out = np.empty((2, xn.size), dtype=xn.dtype)
+    for i in numba.prange(xn.size):
+        v = xn[i] ** p
+        out[0, i] = v
+        out[1, i] = abs(v * p / xn[i]) * xe[i]
+    return out
+
+
+@numba.experimental.jitclass([("_nom", numba.float64), ("_err", numba.float64)])
+class JitUncertainty:
+    """
+    Scalar uncertainty usable inside Numba ``@njit`` functions.
+
+    Supports the same first-order error propagation as `Uncertainty` for
+    ``+``, ``-``, ``*`` and ``/`` between two `JitUncertainty` objects.
+    Obtain one with `Uncertainty.to_jit`.
+    """
+
+    def __init__(self, value, error):
+        self._nom = value
+        self._err = error
+
+    @property
+    def value(self):
+        return self._nom
+
+    @property
+    def error(self):
+        return self._err
+
+    def __add__(self, other):
+        return JitUncertainty(self._nom + other._nom, _hypot(self._err, other._err))
+
+    def __sub__(self, other):
+        return JitUncertainty(self._nom - other._nom, _hypot(self._err, other._err))
+
+    def __mul__(self, other):
+        return JitUncertainty(
+            self._nom * other._nom,
+            _mul_err_1(self._nom, self._err, other._nom, other._err),
+        )
+
+    def __truediv__(self, other):
+        return JitUncertainty(
+            self._nom / other._nom,
+            _div_err_1(self._nom, self._err, other._nom, other._err),
+        )
+
+    def __neg__(self):
+        return JitUncertainty(-self._nom, self._err)
+
+
+def _hypot_elementwise(a, b):
+    return math.sqrt(a * a + b * b)
+
+
+# Built on first use, since the parallel target compiles all signatures eagerly.
+@functools.cache
+def hypot_ufunc():
+    return numba.vectorize(
+        ["float32(float32, float32)", "float64(float64, float64)"],
+        target="parallel",
+        fastmath=_FASTMATH,
+    )(_hypot_elementwise)
+
+
+STACKED_KERNELS = {
+    operator.add: add_stacked,
+    operator.sub: sub_stacked,
+    operator.mul: mul_stacked,
+    operator.truediv: div_stacked,
+}
@@ -23,6 +23,8 @@ def set_display_rounding(val: bool):
 
 
 class UncertaintyDisplay:
+    __slots__ = ("_err", "_nom")
+
     default_format: str = ""
     _nom: npt.NDArray[np.floating] | np.floating | float
     _err: npt.NDArray[np.floating] | np.floating | float
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-import jax
-import jax.numpy as jnp
+import functools
+import importlib
+import importlib.util
+
 import numpy as np
 
 from auto_uncertainties.util import has_length, is_iterable, ndarray_to_scalar
@@ -11,6 +13,9 @@ from auto_uncertainties.util import has_length, is_iterable, ndarray_to_scalar
 HANDLED_UFUNCS = {}
 HANDLED_FUNCTIONS = {}
 
+# JAX is only imported once a gradient is actually needed, since importing it is slow.
+HAS_JAX = importlib.util.find_spec("jax") is not None
+
 __all__ = ["HANDLED_FUNCTIONS", "HANDLED_UFUNCS", "wrap_numpy"]
 
 
@@ -103,13 +108,14 @@ def classify_and_split_args_and_kwargs(*args, **kwargs) -> tuple:
         idx for idx, arg in enumerate(args) if convert_arg(arg, "_nom") is not None
     )
     uncert_arg_nom = tuple(convert_arg(arg, "_nom") for arg in args)
+
     uncert_arg_err = []
     for aidx, arg in enumerate(args):
         carg = convert_arg(arg, "_err")
         if convert_arg(arg, "_err") is not None:
             uncert_arg_err.append(carg)
         else:
-            uncert_arg_err.append(jnp.zeros_like(uncert_arg_nom[aidx]))
+            uncert_arg_err.append(np.zeros_like(uncert_arg_nom[aidx]))
     uncert_arg_err = tuple(uncert_arg_err)
     uncert_kwarg_nom = {key: convert_arg(arg, "_nom") for key, arg in kwargs.items()}
     return uncert_argnums, uncert_arg_nom, uncert_arg_err, uncert_kwarg_nom
@@ -150,6 +156,8 @@ def get_func_from_package(func_str, namespace):
 
 
 def elementwise_grad(g):
+    import jax
+
     def wrapped(*args, **kwargs):
         y, g_vjp = jax.vjp(lambda *a: g(*a, **kwargs), *args)
         return g_vjp(np.ones_like(y))
@@ -200,17 +208,22 @@ def implement_func(
         function that needs to be implemented (e.g. `numpy.argmax` for `numpy.max`)
     :param output_rank: The rank of the output. If it's greater than rank 0 and derivatives are needed,
         jacfwd needs to be used instead of grad.
-    :param custom_jax_dispatch:
+    :param custom_jax_dispatch: Dotted path of the JAX function to differentiate, relative to the
+        ``jax`` package (e.g. ``"scipy.integrate.trapezoid"``), if not ``jax.numpy.<func_str>``
     """
 
     # If Jax+NumPy is not available, do not attempt implement that which does not exist
-    if jnp is None:
+    if not HAS_JAX:
         return
 
-    if custom_jax_dispatch is not None:
-        func = custom_jax_dispatch
-    else:
-        func = get_func_from_package(func_str, jnp)
+    # Resolved on first use, so that JAX is not imported until a gradient is needed
+    @functools.cache
+    def get_jax_func():
+        if custom_jax_dispatch is not None:
+            module, _, name = custom_jax_dispatch.rpartition(".")
+            return getattr(importlib.import_module(f"jax.{module}"), name)
+        return get_func_from_package(func_str, importlib.import_module("jax.numpy"))
+
     # Skip the JAX overhead if you dont need gradient info
     func_np = get_func_from_package(func_str, np)
 
@@ -230,7 +243,9 @@ def implement_func(
             bcast_args_nom = np.broadcast_arrays(*uncert_arg_nom)
             bcast_args_err = np.broadcast_arrays(*uncert_arg_err)
             value = func_np(*bcast_args_nom, **uncert_kwarg_nom)
-            grads = elementwise_grad(func)(*bcast_args_nom, **uncert_kwarg_nom)
+            grads = elementwise_grad(get_jax_func())(
+                *bcast_args_nom, **uncert_kwarg_nom
+            )
             error_dot_grad_sqr = [
                 (e * g) ** 2 for e, g in zip(bcast_args_err, grads, strict=False)
             ]
@@ -269,7 +284,9 @@ def implement_func(
             bcast_args_err = np.broadcast_arrays(*uncert_arg_err)
 
             val = func_np(*bcast_args_nom, **uncert_kwarg_nom)
-            grads = elementwise_grad(func)(*bcast_args_nom, **uncert_kwarg_nom)
+            grads = elementwise_grad(get_jax_func())(
+                *bcast_args_nom, **uncert_kwarg_nom
+            )
             if axis is not None:
                 axis = tuple(axis)
                 error_dot_grad_sqr = [
@@ -450,7 +467,7 @@ implement_func(
     "function",
     "trapz",
     implement_mode="reduction_binary",
-    custom_jax_dispatch=jax.scipy.integrate.trapezoid,
+    custom_jax_dispatch="scipy.integrate.trapezoid",
 )
 
 bcast_reduction_unary = ["std", "sum", "var", "mean", "ptp", "median"]
@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable, Sequence
 import copy
 from functools import wraps
+import itertools
 import locale
 import math
 import operator
@@ -20,7 +21,6 @@ from typing import (
 )
 import warnings
 
-import joblib
 import numpy as np
 import numpy.typing as npt
 
@@ -32,6 +32,16 @@ from auto_uncertainties import (
     NegativeStdDevError,
     UncertaintyDisplay,
 )
+from auto_uncertainties._kernels import (
+    HAS_NUMBA,
+    div_err,
+    hypot2,
+    mul_err,
+    numba_kernels,
+    pow_stacked,
+    stacked_op,
+    use_kernels,
+)
 from auto_uncertainties.numpy import HANDLED_FUNCTIONS, HANDLED_UFUNCS, wrap_numpy
 from auto_uncertainties.util import deprecated, ignore_runtime_warnings
 
@@ -170,14 +180,36 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
        * If the ``error`` parameter is not finite, the resulting `Uncertainty` object
          will have its ``error`` attribute set to zero.
 
+       * NumPy arrays supplied for ``value`` and ``error`` are used without copying.
+         As with NumPy arrays, augmented assignments with a scalar (e.g., ``u *= 2``)
+         modify them in place, which is visible through every array or `Uncertainty`
+         sharing them (including slices obtained by indexing).
+
     .. seealso::
 
         * `from_quantities`
     """
 
+    # _nom and _err are slots of UncertaintyDisplay.
+    __slots__ = ("__weakref__", "_data", "_hash", "_is_array", "_rel")
+
     _nom: T
     _err: T
 
+    # Vector uncertainties may keep their central values and errors in a single
+    # C-contiguous buffer of shape (2, *shape), with _nom and _err as views of its rows.
+    # Arithmetic between two such objects runs as one fused kernel over the buffer.
+    _data: npt.NDArray | None
+
+    # Whether _nom and _err are arrays, set together with them by _assign.
+    _is_array: bool
+
+    # Lazily computed for scalars by __hash__ and relative, and reset by _invalidate.
+    # Vectors can be modified through their arrays, so their hash and relative
+    # uncertainty are recomputed on every call.
+    _hash: int | None
+    _rel: T | None
+
     # __new__ intercepts non-finite values, Pint Quantity inputs, and sequences of Quantity objects.
     @overload
     def __new__(
@@ -192,6 +224,21 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
     @overload
     def __new__(cls, value, error=...) -> Uncertainty: ...
     def __new__(cls, value, error=None):
+        # Fast path for the most common case of a Python float central value, which
+        # skips the unit, sequence, and array checks below. Note that np.float64 is a
+        # subclass of float, hence the exact type checks.
+        if type(value) is float and (
+            error is None or type(error) is float or type(error) is np.float64
+        ):
+            if error is None or not math.isfinite(error):
+                error = 0.0
+            elif error < 0:
+                msg = f"Got negative value ({error}) for the standard deviation"
+                raise NegativeStdDevError(msg)
+            instance = super().__new__(cls)
+            instance._assign(cast(T, value), cast(T, float(error)))
+            return instance
+
         # Use from_quantities if one or more Pint Quantity objects were supplied.
         if _check_units(value, error)[2] is not None:
             return cls.from_quantities(value, error)
@@ -283,12 +330,14 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
 
             caster = np.float64 if isinstance(value, np.number) else float
             if isinstance(value, int | np.integer):
-                self._nom = cast(T, caster(value))
-                self._err = cast(
-                    T,
-                    caster(error)
-                    if (error is not None and np.isfinite(error))
-                    else caster(0.0),
+                self._assign(
+                    cast(T, caster(value)),
+                    cast(
+                        T,
+                        caster(error)
+                        if (error is not None and np.isfinite(error))
+                        else caster(0.0),
+                    ),
                 )
             else:
                 caster = (
@@ -296,12 +345,14 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
                     if isinstance(error, np.floating) and isinstance(value, np.floating)
                     else caster
                 )
-                self._nom = cast(T, value)
-                self._err = cast(
-                    T,
-                    caster(error)
-                    if (error is not None and np.isfinite(error))
-                    else caster(0.0),
+                self._assign(
+                    cast(T, value),
+                    cast(
+                        T,
+                        caster(error)
+                        if (error is not None and np.isfinite(error))
+                        else caster(0.0),
+                    ),
                 )
 
         else:
@@ -315,31 +366,29 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
             msg = f"Error sequence must be the same length as value sequence (got len(value)={len(value)}, len(error)={len(error)})"
             raise ValueError(msg)
 
-        val = np.empty(len(value), dtype=np.float64)
-        err = np.empty(len(value), dtype=np.float64)
+        error = 0.0 if error is None else error
+        errors = itertools.repeat(error) if isinstance(error, ScalarT) else error
 
-        if len(value) > 0:
-            error = 0.0 if error is None else error
-            reshaped_error = (
-                (np.ones(len(value), dtype=np.float64) * error)
-                if isinstance(error, ScalarT)
-                else error
-            )
-            for i, v in enumerate(value):
+        def pairs():
+            for v, e in zip(value, errors, strict=False):
                 if isinstance(v, Uncertainty):
-                    val[i] = v.value
-                    err[i] = v.error
+                    yield v._nom, v._err
                 elif isinstance(v, ScalarT):
-                    val[i] = v
-                    if not isinstance(reshaped_error[i], ScalarT):
-                        msg = f"Error sequence must be of scalars (found element of type {type(err[i])} instead)"
+                    if not isinstance(e, ScalarT):
+                        msg = f"Error sequence must be of scalars (found element of type {type(e)} instead)"
                         raise TypeError(msg)
-                    err[i] = reshaped_error[i]
+                    yield v, e
                 else:
                     msg = f"Value sequence must be of scalars or Uncertainty objects (found element of type {type(v)} instead)"
                     raise TypeError(msg)
 
-        self.__init__(val, err, skip=False)
+        # Fill the values and errors in a single pass, then transpose into the stacked layout.
+        data = np.fromiter(pairs(), dtype=np.dtype((np.float64, 2)), count=len(value))
+        self._init_stacked(data.T.copy())
+
+    def _init_stacked(self, data: npt.NDArray[np.floating]) -> None:
+        self._init_vec(data[0], data[1])
+        self._data = data
 
     def _init_vec(
         self,
@@ -371,8 +420,20 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
         if issubclass(error.dtype.type, np.integer):
             error = error.astype(np.float64)
 
-        self._nom = cast(T, value)
-        self._err = cast(T, error)
+        self._assign(cast(T, value), cast(T, error))
+
+    def _assign(self, value: T, error: T) -> None:
+        """Set the central value and error, without a stacked buffer and with empty caches."""
+        self._nom = value
+        self._err = error
+        self._is_array = isinstance(value, np.ndarray) and isinstance(error, np.ndarray)
+        self._data = None
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Reset the cached hash and relative uncertainty after an in-place modification."""
+        self._hash = None
+        self._rel = None
 
     @property
     def is_vector(self) -> bool:
@@ -391,17 +452,30 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
 
     @property
     def relative(self) -> T:
-        """The relative uncertainty of the `Uncertainty` object."""
+        """
+        The relative uncertainty of the `Uncertainty` object.
+
+        The result is cached for scalar uncertainties.
+        """
+        if self._is_array:
+            return self._relative()
+        if self._rel is None:
+            self._rel = self._relative()
+        return self._rel
+
+    def _relative(self) -> T:
         # Vector uncertainty
         if isinstance(self._nom, np.ndarray) and isinstance(self._err, np.ndarray):
-            rel = np.zeros_like(self._nom)
-            inf = np.isinf(self._nom)
-            nan = self._nom == 0
-            valid = ~inf & ~nan
-            rel[valid] = self._err[valid] / np.abs(self._nom[valid])
-            rel[inf] = np.inf
-            rel[nan] = np.nan
-            return rel
+            # NaN where the central value is zero (or NaN), inf where it is infinite.
+            rel = np.full_like(self._nom, np.nan)
+            np.divide(
+                self._err,
+                np.abs(self._nom),
+                out=rel,
+                where=np.isfinite(self._nom) & (self._nom != 0),
+            )
+            rel[np.isinf(self._nom)] = np.inf
+            return cast(T, rel)
 
         # Scalar uncertainty
         try:
@@ -446,6 +520,30 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
 
         return self.__class__(self._nom, new_err)
 
+    @classmethod
+    def _unchecked(cls, value: T, error: T) -> Uncertainty[T]:
+        """
+        Create an `Uncertainty` without any type conversion or validation.
+
+        Only for parts of an existing `Uncertainty` (elements, rows, or slices),
+        which have been validated already.
+        """
+        instance = super().__new__(cls)
+        instance._assign(value, error)
+        return instance
+
+    @classmethod
+    def _from_stacked(cls, data: npt.NDArray[np.floating]) -> Uncertainty:
+        """
+        Create a vector `Uncertainty` from a C-contiguous float array of shape ``(2, ...)``,
+        holding the central values in ``data[0]`` and the errors in ``data[1]``.
+
+        The buffer is used without copying.
+        """
+        instance = super().__new__(cls)
+        instance._init_stacked(data)
+        return instance
+
     @classmethod
     def from_string(cls, string: str) -> Uncertainty:
         """
@@ -575,8 +673,7 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
         return {"nominal_value": self._nom, "std_devs": self._err}
 
     def __setstate__(self, state) -> None:
-        self._nom = state["nominal_value"]
-        self._err = state["std_devs"]
+        self._assign(state["nominal_value"], state["std_devs"])
 
     def __getnewargs__(self) -> tuple[T, T]:
         return self._nom, self._err
@@ -597,11 +694,15 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
 
     def __add__(self, other):
         if isinstance(other, Uncertainty):
+            if _fusable(self, other):
+                return self._from_stacked(
+                    stacked_op(operator.add, self._data, other._data)
+                )
             new_mag = self._nom + other._nom
-            new_err = np.sqrt(self._err**2 + other._err**2)
+            new_err = _sum_err(self, other, new_mag)
         elif isinstance(other, self._HANDLED_TYPES):
             new_mag = self._nom + other
-            new_err = self._err
+            new_err = copy.copy(self._err)
         else:
             return NotImplemented
         try:
@@ -613,11 +714,15 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
 
     def __sub__(self, other):
         if isinstance(other, Uncertainty):
+            if _fusable(self, other):
+                return self._from_stacked(
+                    stacked_op(operator.sub, self._data, other._data)
+                )
             new_mag = self._nom - other._nom
-            new_err = np.sqrt(self._err**2 + other._err**2)
+            new_err = _sum_err(self, other, new_mag)
         elif isinstance(other, self._HANDLED_TYPES):
             new_mag = self._nom - other
-            new_err = self._err
+            new_err = copy.copy(self._err)
         else:
             return NotImplemented
         try:
@@ -630,10 +735,12 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
 
     def __mul__(self, other):
         if isinstance(other, Uncertainty):
+            if _fusable(self, other):
+                return self._from_stacked(
+                    stacked_op(operator.mul, self._data, other._data)
+                )
             new_mag = self._nom * other._nom
-            new_err = np.sqrt(
-                (other._nom * self._err) ** 2 + (self._nom * other._err) ** 2
-            )
+            new_err = mul_err(self._nom, self._err, other._nom, other._err)
         elif isinstance(other, self._HANDLED_TYPES):
             new_mag = self._nom * other
             new_err = np.abs(self._err * other)
@@ -649,11 +756,12 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
     @ignore_runtime_warnings
     def __truediv__(self, other):
         if isinstance(other, Uncertainty):
+            if _fusable(self, other):
+                return self._from_stacked(
+                    stacked_op(operator.truediv, self._data, other._data)
+                )
             new_mag = self._nom / other._nom
-            new_err = np.sqrt(
-                (self._err / other._nom) ** 2
-                + (self._nom * other._err / other._nom**2) ** 2
-            )
+            new_err = div_err(self._nom, self._err, other._nom, other._err)
         elif isinstance(other, self._HANDLED_TYPES):
             new_mag = self._nom / other
             new_err = np.abs(self._err / other)
@@ -682,6 +790,57 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
     __div__ = __truediv__
     __rdiv__ = __rtruediv__
 
+    # In-place operations with a real scalar update the (writable) arrays of a
+    # vector Uncertainty directly, without allocating new ones. Every other case
+    # falls back to the regular operators above.
+    def _can_update_inplace(self, other) -> bool:
+        """Whether ``other`` is a finite real scalar that can update ``self`` in place."""
+        return (
+            self._is_array
+            and self._nom.flags.writeable
+            and self._err.flags.writeable
+            # Updating one array must not change the other one.
+            and not np.may_share_memory(self._nom, self._err)
+            and isinstance(other, int | float | np.integer | np.floating)
+            and (not isinstance(other, float | np.floating) or math.isfinite(other))
+            and np.result_type(self._nom, other) == self._nom.dtype
+            and np.result_type(self._err, other) == self._err.dtype
+        )
+
+    def __iadd__(self, other):
+        if not self._can_update_inplace(other):
+            return NotImplemented
+        np.add(self._nom, other, out=self._nom)
+        self._invalidate()
+        return self
+
+    def __isub__(self, other):
+        if not self._can_update_inplace(other):
+            return NotImplemented
+        np.subtract(self._nom, other, out=self._nom)
+        self._invalidate()
+        return self
+
+    def __imul__(self, other):
+        if not self._can_update_inplace(other):
+            return NotImplemented
+        np.multiply(self._nom, other, out=self._nom)
+        np.multiply(self._err, abs(other), out=self._err)
+        # As in the constructor, errors that overflowed are replaced with zero.
+        self._err[~np.isfinite(self._err)] = 0
+        self._invalidate()
+        return self
+
+    @ignore_runtime_warnings
+    def __itruediv__(self, other):
+        if not self._can_update_inplace(other) or other == 0:
+            return NotImplemented
+        np.divide(self._nom, other, out=self._nom)
+        np.divide(self._err, abs(other), out=self._err)
+        self._err[~np.isfinite(self._err)] = 0
+        self._invalidate()
+        return self
+
     def __floordiv__(self, other):
         if isinstance(other, Uncertainty):
             new_mag = self._nom // other._nom
@@ -710,12 +869,12 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
             new_mag = self._nom % other
         else:
             return NotImplemented
-        return self.__class__(new_mag, self._err)
+        return self.__class__(new_mag, copy.copy(self._err))
 
     def __rmod__(self, other):
         if isinstance(other, self._HANDLED_TYPES):
             new_mag = other % self._nom
-            return self.__class__(new_mag, self._err)
+            return self.__class__(new_mag, copy.copy(self._err))
         else:
             return NotImplemented
 
@@ -727,24 +886,32 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
 
     @ignore_runtime_warnings
     def __pow__(self, other):
-        # Self ** other
+        # Self ** other, fused into one pass for a float array and a constant exponent
+        if (
+            isinstance(other, int | float | np.integer | np.floating)
+            and use_kernels(self._nom, self._err)
+            and np.result_type(self._nom, other) == self._nom.dtype
+        ):
+            return self._from_stacked(pow_stacked(self._nom, self._err, other))
+
         A = self._nom
         sA = self._err
         if isinstance(other, Uncertainty):
             B = other._nom
             sB = other._err
+            new_mag = A**B
+            new_err = np.abs(new_mag) * np.sqrt(
+                (B / A * sA) ** 2 + (np.log(np.abs(A)) * sB) ** 2
+            )
 
         elif isinstance(other, self._HANDLED_TYPES):
-            B = other
-            sB = 0
+            # Constant exponent: |p * x ** (p - 1)| * dx, evaluated as in pow_stacked,
+            # so that the result does not depend on which path is taken.
+            new_mag = A**other
+            new_err = np.abs(new_mag * other / A) * sA
         else:
             return NotImplemented
 
-        new_mag = A**B
-        new_err = np.abs(new_mag) * np.sqrt(
-            (B / A * sA) ** 2 + (np.log(np.abs(A)) * sB) ** 2
-        )
-
         return self.__class__(new_mag, new_err)
 
     @ignore_runtime_warnings
@@ -768,13 +935,13 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
         return self.__class__(new_mag, new_err)
 
     def __abs__(self):
-        return self.__class__(abs(self._nom), self._err)
+        return self.__class__(abs(self._nom), copy.copy(self._err))
 
     def __pos__(self):
-        return self.__class__(operator.pos(self._nom), self._err)
+        return self.__class__(operator.pos(self._nom), copy.copy(self._err))
 
     def __neg__(self):
-        return self.__class__(operator.neg(self._nom), self._err)
+        return self.__class__(operator.neg(self._nom), copy.copy(self._err))
 
     def _compare(self, other, op):
         if isinstance(other, Uncertainty):
@@ -808,6 +975,15 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
             return not out
 
     def __eq__(self, other):
+        if other is self or (
+            isinstance(other, Uncertainty)
+            and other._nom is self._nom
+            and other._err is self._err
+        ):
+            # Same central values and errors: skip the comparison of the errors
+            # (and the warnings). Only NaN central values can compare unequal.
+            return bool(np.all(self._nom == self._nom))
+
         if self.is_vector:
             # Compare vector Uncertainty with vector Uncertainty.
             if isinstance(other, Uncertainty):
@@ -866,17 +1042,22 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
 
     def __round__(self, ndigits):
         if isinstance(self._nom, np.ndarray | np.number):
-            return self.__class__(np.round(self._nom, decimals=ndigits), self._err)
+            return self.__class__(
+                np.round(self._nom, decimals=ndigits), copy.copy(self._err)
+            )
         else:
             return self.__class__(float(round(self._nom, ndigits=ndigits)), self._err)
 
     def __hash__(self) -> int:
         if self.is_vector:
+            import joblib
+
             digest = joblib.hash((self._nom, self._err), hash_name="sha1")
             digest = "" if digest is None else digest
             return int.from_bytes(bytes(digest, encoding="utf-8"), "big")
-        else:
-            return hash((self._nom, self._err))
+        if self._hash is None:
+            self._hash = hash((self._nom, self._err))
+        return self._hash
 
     # ====================================================================
     # ------------------ NUMPY FUNCTION / UFUNC SUPPORT ------------------
@@ -981,7 +1162,7 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
            Implemented only for vector uncertainty objects.
         """
         if isinstance(self._nom, np.ndarray):
-            return self.__class__(self._nom.clip(*args, **kwargs), self._err)
+            return self.__class__(self._nom.clip(*args, **kwargs), copy.copy(self._err))
 
     @_unsupported_type("scal")
     def fill(self, value) -> None:
@@ -996,6 +1177,7 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
 
         """
         if isinstance(self._nom, np.ndarray):
+            self._invalidate()
             return self._nom.fill(value)
 
     @_unsupported_type("scal")
@@ -1016,8 +1198,22 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
         """
         if isinstance(self._nom, np.ndarray) and isinstance(self._err, np.ndarray):
             if isinstance(values, Uncertainty):
-                self._nom.put(indices, values._nom, mode)
-                self._err.put(indices, values._err, mode)
+                if (
+                    self._data is not None
+                    and mode == "raise"
+                    and np.size(indices) == np.size(values._nom)
+                ):
+                    # Write the central values and errors with a single indexed
+                    # assignment into the (flattened) stacked buffer.
+                    self._data.reshape(2, -1)[:, np.ravel(indices)] = (
+                        values._data.reshape(2, -1)
+                        if values._data is not None
+                        else (np.ravel(values._nom), np.ravel(values._err))
+                    )
+                else:
+                    self._nom.put(indices, values._nom, mode)
+                    self._err.put(indices, values._err, mode)
+                self._invalidate()
             else:
                 msg = "Can only 'put' Uncertainty objects into Uncertainty objects"
                 raise TypeError(msg)
@@ -1031,6 +1227,8 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
 
            Implemented only for vector uncertainty objects.
         """
+        if self._data is not None:
+            return self._from_stacked(self._data.copy())
         if isinstance(self._nom, np.ndarray) and isinstance(self._err, np.ndarray):
             return self.__class__(self._nom.copy(), self._err.copy())
 
@@ -1046,8 +1244,7 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
            Implemented only for vector uncertainty objects.
         """
         if isinstance(self._nom, np.ndarray) and isinstance(self._err, np.ndarray):
-            for u, v in zip(self._nom.flat, self._err.flat, strict=False):
-                yield self.__class__(u, v)
+            yield from map(self._unchecked, self._nom.flat, self._err.flat)
 
     @property
     @_unsupported_type("scal")
@@ -1069,6 +1266,9 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
         if isinstance(self._nom, np.ndarray) and isinstance(self._err, np.ndarray):
             self._nom.shape = value
             self._err.shape = value
+            if self._data is not None:
+                self._data.shape = (2, *self._nom.shape)
+            self._invalidate()
 
     @property
     @_unsupported_type("scal")
@@ -1108,20 +1308,10 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
             try:
                 nom = self._nom.tolist()
                 err = self._err.tolist()
-                if not isinstance(nom, list):
-                    return self.__class__(nom, err)
-                else:
-                    return [
-                        (
-                            self.__class__(n, e).tolist()
-                            if isinstance(n, list)
-                            else self.__class__(n, e)
-                        )
-                        for n, e in zip(nom, err, strict=False)
-                    ]
             except AttributeError:
                 msg = f"{type(self._nom).__name__}' does not support tolist."
                 raise AttributeError(msg) from None
+            return _nested_unchecked(self._unchecked, nom, err)
 
     @_unsupported_type("scal")
     def view(self):
@@ -1139,7 +1329,7 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
     def __iter__(self):
         if isinstance(self._nom, np.ndarray) and isinstance(self._err, np.ndarray):
             for v, e in zip(self._nom, self._err, strict=False):
-                yield self.__class__(v, e)
+                yield self._unchecked(v, e)
 
     @_unsupported_type("scal")
     def __len__(self) -> int:  # type: ignore
@@ -1150,15 +1340,20 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
     def __getitem__(self, key: int) -> Uncertainty:  # type: ignore
         if isinstance(self._nom, np.ndarray) and isinstance(self._err, np.ndarray):
             try:
-                return self.__class__(self._nom[key], self._err[key])
+                val, err = self._nom[key], self._err[key]
             except IndexError as e:
                 msg = f"Index '{key}' not supported"
                 raise IndexError(msg) from e
+            # Avoid zero-dimensional arrays, e.g. from self[..., 0] on a 1D object.
+            if isinstance(val, np.ndarray) and val.ndim == 0:
+                val, err = val[()], err[()]
+            return self._unchecked(val, err)
 
     @_unsupported_type("scal")
     def __setitem__(self, key: int, value: Uncertainty) -> None:
         if isinstance(self._nom, np.ndarray) and isinstance(self._err, np.ndarray):
             # If value is nan, just set the value in those regions to nan and return. This is the only case where a scalar can be passed as an argument!
+            self._invalidate()
             if not isinstance(value, Uncertainty):
                 if not np.isfinite(value):
                     self._nom[key] = value
@@ -1205,6 +1400,26 @@ class Uncertainty(Generic[T], UncertaintyDisplay):
             )
         return int(self._nom)
 
+    @_unsupported_type("vec")
+    def to_jit(self):
+        """
+        Convert to a scalar uncertainty that can be used inside Numba ``@njit`` functions.
+
+        The returned object supports ``+``, ``-``, ``*`` and ``/`` with other
+        objects returned by this method, with the same error propagation as
+        `Uncertainty`.
+
+        :raise ImportError: If Numba is not installed
+
+        .. note::
+
+           Implemented only for scalar uncertainty objects.
+        """
+        if not HAS_NUMBA:
+            msg = "Numba is required to convert Uncertainty objects for use with @njit"
+            raise ImportError(msg)
+        return numba_kernels().JitUncertainty(float(self._nom), float(self._err))
+
     @_unsupported_type("vec")
     def __complex__(self):
         msg = "The uncertainty is stripped when downcasting to float."
@@ -1259,6 +1474,41 @@ def std_devs(x: Any) -> UType | Any:
                 return x2.error
 
 
+def _fusable(a: Uncertainty, b: Uncertainty) -> bool:
+    """Whether ``a`` and ``b`` can be combined by the fused kernels on their stacked buffers."""
+    return (
+        a._data is not None
+        and b._data is not None
+        and use_kernels(a._data, b._data)
+        and np.shape(a._nom) == np.shape(b._nom)
+    )
+
+
+def _nested_unchecked(make: Callable, nom, err):
+    """Build the nested lists of `tolist`, with ``make`` applied to every pair of elements."""
+    if not isinstance(nom, list):
+        return make(nom, err)
+    if nom and isinstance(nom[0], list):
+        return [_nested_unchecked(make, n, e) for n, e in zip(nom, err, strict=True)]
+    return list(map(make, nom, err))
+
+
+def _sum_err(a: Uncertainty, b: Uncertainty, new_mag):
+    """
+    Error of ``a + b`` or ``a - b``, whose central value is ``new_mag``.
+
+    For scalars, if one operand is exact, the error of the other one is passed
+    through, skipping the square root. Vectors always go through ``hypot2``, since
+    checking an error array for zeros costs as much as the sum itself.
+    """
+    if not isinstance(new_mag, np.ndarray):
+        if b._err == 0:
+            return copy.copy(a._err)
+        if a._err == 0:
+            return copy.copy(b._err)
+    return hypot2(a._err, b._err)
+
+
 def _check_units(value, err) -> tuple[Any, Any, Any]:
     mag_has_units = hasattr(value, "units")
     mag_units = getattr(value, "units", None)
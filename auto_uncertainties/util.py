@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 from functools import wraps
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 import warnings
 
-from jax import Array
 import numpy as np
 from numpy.typing import NDArray
 
 from . import DowncastWarning
 
+if TYPE_CHECKING:
+    from jax import Array
+
 T = TypeVar("T", bound=np.generic, covariant=True)
 
 
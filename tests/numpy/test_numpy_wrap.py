@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import subprocess
+import sys
 import warnings
 
 from hypothesis import given, settings
@@ -163,3 +165,16 @@ def test_unary_reduction(unom, uerr, units, op):
         v *= units
     oper = getattr(np, op)
     op_test(oper, u, units=units)
+
+
+def test_jax_import_deferred():
+    code = (
+        "import sys\n"
+        "import numpy as np\n"
+        "from auto_uncertainties import Uncertainty\n"
+        "u = Uncertainty([1.0, 2.0], [0.1, 0.2])\n"
+        "u = u * u + 1.0\n"
+        "np.argmax(u)\n"
+        "assert 'jax' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from hypothesis import HealthCheck, given, settings
+from hypothesis.extra import numpy as hnp
+import hypothesis.strategies as st
+import numpy as np
+import pytest
+
+from auto_uncertainties import Uncertainty, _kernels
+
+error_strategy = st.floats(min_value=0, max_value=1e3)
+
+# Numba compiles each kernel on first use, which would trip the default deadline.
+kernel_settings = settings(
+    deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture]
+)
+
+
+@pytest.fixture(params=["numba", "numexpr", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "numba" and not _kernels.HAS_NUMBA:
+        pytest.skip("numba is not installed")
+    if request.param == "numexpr" and not _kernels.HAS_NUMEXPR:
+        pytest.skip("numexpr is not installed")
+    monkeypatch.setattr(_kernels, "HAS_NUMBA", request.param == "numba")
+    monkeypatch.setattr(_kernels, "HAS_NUMEXPR", request.param == "numexpr")
+    # Exercise the kernels and numexpr on the small arrays of these tests as well.
+    monkeypatch.setattr(_kernels, "KERNEL_MIN_SIZE", 0)
+    monkeypatch.setattr(_kernels, "NUMEXPR_MIN_SIZE", 0)
+
+
+@kernel_settings
+@given(
+    a=hnp.arrays(np.float64, (2, 5), elements=error_strategy),
+    b=hnp.arrays(np.float64, (2, 5), elements=error_strategy),
+)
+def test_hypot2(backend, a, b):
+    result = _kernels.hypot2(a, b)
+
+    assert result.shape == a.shape
+    np.testing.assert_allclose(result, np.sqrt(a**2 + b**2))
+
+
+@kernel_settings
+@given(
+    a=hnp.arrays(np.float64, (3, 1), elements=error_strategy),
+    b=hnp.arrays(np.float64, (1, 4), elements=error_strategy),
+)
+def test_hypot2_broadcast(backend, a, b):
+    result = _kernels.hypot2(a, b)
+
+    assert result.shape == (3, 4)
+    np.testing.assert_allclose(result, np.sqrt(a**2 + b**2))
+
+
+def test_hypot2_scalar(backend):
+    assert _kernels.hypot2(3.0, 4.0) == 5.0
+
+
+def test_hypot2_signatures(backend):
+    # Inputs outside the compiled float64 signatures must still be handled.
+    a = np.arange(12, dtype=np.float32).reshape(3, 4)
+    b = np.ones((3, 4), dtype=np.float32)
+    np.testing.assert_allclose(_kernels.hypot2(a, b), np.sqrt(a**2 + b**2))
+
+    a64, b64 = a.astype(np.float64).T, b.astype(np.float64).T
+    np.testing.assert_allclose(_kernels.hypot2(a64, b64), np.sqrt(a64**2 + b64**2))
+
+
+@kernel_settings
+@given(
+    an=hnp.arrays(np.float64, 8, elements=st.floats(min_value=-1e3, max_value=1e3)),
+    ae=hnp.arrays(np.float64, 8, elements=error_strategy),
+    bn=hnp.arrays(np.float64, 8, elements=st.floats(min_value=1, max_value=1e3)),
+    be=hnp.arrays(np.float64, 8, elements=error_strategy),
+)
+def test_mul_div_err(backend, an, ae, bn, be):
+    np.testing.assert_allclose(
+        _kernels.mul_err(an, ae, bn, be), np.sqrt((bn * ae) ** 2 + (an * be) ** 2)
+    )
+    np.testing.assert_allclose(
+        _kernels.div_err(an, ae, bn, be),
+        np.sqrt((ae / bn) ** 2 + (an * be / bn**2) ** 2),
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.float16, np.float32, np.float64, np.longdouble])
+def test_kernel_dtypes(backend, dtype):
+    an = np.linspace(-3, 3, 7, dtype=dtype)
+    bn = np.linspace(1, 2, 7, dtype=dtype)
+    ae = np.full(7, 0.1, dtype=dtype)
+    be = np.full(7, 0.2, dtype=dtype)
+
+    for result, expected in [
+        (_kernels.hypot2(ae, be), np.sqrt(ae**2 + be**2)),
+        (_kernels.mul_err(an, ae, bn, be), np.sqrt((bn * ae) ** 2 + (an * be) ** 2)),
+        (
+            _kernels.div_err(an, ae, bn, be),
+            np.sqrt((ae / bn) ** 2 + (an * be / bn**2) ** 2),
+        ),
+    ]:
+        assert result.dtype == dtype
+        np.testing.assert_allclose(
+            result, expected, rtol=1e-3 if dtype == np.float16 else 1e-6
+        )
+
+
+def test_readonly_arrays(backend):
+    # Read-only central values, as from np.asarray(jax_array) or np.frombuffer.
+    nom = np.linspace(1, 2, 8)
+    err = np.full(8, 0.1)
+    nom.flags.writeable = False
+    u = Uncertainty(nom, err)
+    w = Uncertainty(nom.copy(), err.copy())
+
+    for result, expected in [
+        (u + u, w + w),
+        (u * u, w * w),
+        (u / u, w / w),
+        (u**2, w**2),
+    ]:
+        np.testing.assert_allclose(result.value, expected.value)
+        np.testing.assert_allclose(result.error, expected.error)
+
+
+@pytest.mark.parametrize("dtype", [">f8", "<f8", ">f4", "<f4"])
+def test_byte_order(backend, dtype):
+    nom = np.linspace(1, 2, 8)
+    err = np.full(8, 0.1)
+    u = Uncertainty(nom.astype(dtype), err.astype(dtype))
+    w = Uncertainty(nom, err)
+
+    for result, expected in [
+        (u + u, w + w),
+        (u * u, w * w),
+        (u / u, w / w),
+        (u**2, w**2),
+    ]:
+        np.testing.assert_allclose(result.value, expected.value, rtol=1e-6)
+        np.testing.assert_allclose(result.error, expected.error, rtol=1e-6)
+
+
+def test_numba_import_deferred():
+    pytest.importorskip("numba")
+    code = (
+        "import sys\n"
+        "import numpy as np\n"
+        "from auto_uncertainties import Uncertainty, _kernels\n"
+        "u = Uncertainty(np.ones(10), np.ones(10)) * 2.0\n"
+        "assert 'numba' not in sys.modules\n"
+        "n = _kernels.KERNEL_MIN_SIZE\n"
+        "u = Uncertainty(np.ones(n), np.ones(n))\n"
+        "u = u * u\n"
+        "assert 'numba' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
+def test_jit_uncertainty():
+    numba = pytest.importorskip("numba")
+
+    u1 = Uncertainty(2.0, 0.3)
+    u2 = Uncertainty(-5.0, 0.4)
+
+    @numba.njit
+    def combine(a, b):
+        return (a + b) * a / b - b
+
+    result = combine(u1.to_jit(), u2.to_jit())
+    expected = (u1 + u2) * u1 / u2 - u2
+
+    assert result.value == pytest.approx(expected.value)
+    assert result.error == pytest.approx(expected.error)
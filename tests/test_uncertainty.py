@@ -5,9 +5,10 @@ import itertools
 import locale
 import math
 import operator
+from unittest import mock
 import warnings
 
-from hypothesis import assume, given
+from hypothesis import assume, given, settings
 from hypothesis.extra import numpy as hnp
 import hypothesis.strategies as st
 import joblib
@@ -29,6 +30,7 @@ from auto_uncertainties import (
     ScalarUncertainty,
     Uncertainty,
     VectorUncertainty,
+    _kernels,
     nominal_values,
     set_downcast_error,
     set_equality_error,
@@ -193,7 +195,11 @@ def test_scalar_add_sub(v1, e1, v2, e2, op):
     if np.isfinite(v1) and np.isfinite(v2):
         assert math.isclose(u.value, op(u1.value, u2.value))
     if np.isfinite(e1) and np.isfinite(e2):
-        assert math.isclose(u.error, np.sqrt(u1.error**2 + u2.error**2))
+        # The error of an exact operand's partner is passed through unchanged.
+        if u1.error and u2.error:
+            assert math.isclose(u.error, np.sqrt(u1.error**2 + u2.error**2))
+        else:
+            assert u.error == u1.error + u2.error
 
 
 @pytest.mark.filterwarnings("ignore::RuntimeWarning")
@@ -297,6 +303,7 @@ def test_mixed_arithmetic(v1, e1, v2, e2, op):
         ]
     ),
 )
+@settings(deadline=3000)  # The first call imports JAX.
 @pytest.mark.filterwarnings("ignore::RuntimeWarning")
 def test_numpy_math_ops(v1, e1, op):
     u1 = Uncertainty(v1, e1)
@@ -643,7 +650,10 @@ class TestUncertainty:
         result = op(u1, u2)
         assert isinstance(result, Uncertainty)
         assert result.value == op(u1.value, u2.value)
-        assert result.error == np.sqrt(u1.error**2 + u2.error**2)
+        if u1.error and u2.error:
+            assert result.error == np.sqrt(u1.error**2 + u2.error**2)
+        else:
+            assert result.error == u1.error + u2.error
 
         result = op(u1, v2)
         assert isinstance(result, Uncertainty)
@@ -834,12 +844,11 @@ class TestUncertainty:
             + (np.log(np.abs(u1.value)) * u2.error) ** 2
         )
 
+        # A constant exponent uses |p * x ** (p - 1)| * dx directly.
         result = u1**v2
         assert isinstance(result, Uncertainty)
         assert result.value == u1.value**v2
-        assert result.error == np.abs(result.value) * np.sqrt(
-            (v2 / u1.value * u1.error) ** 2 + (np.log(np.abs(u1.value)) * 0) ** 2
-        )
+        assert result.error == np.abs(result.value * v2 / u1.value) * u1.error
 
         # Reverse case
         result = v2**u1
@@ -1107,6 +1116,14 @@ class TestVectorUncertainty:
 
         assert np.array_equal(v.value, np.array([1, 98, 3]))
 
+        # Stacked layout, written with a single indexed assignment.
+        v = Uncertainty([Uncertainty(1, 4), Uncertainty(2, 5), Uncertainty(3, 6)])
+        v.put([2, 0], Uncertainty([Uncertainty(7, 8), Uncertainty(9, 10)]))
+        v.put(1, Uncertainty(11, 12))
+
+        assert np.array_equal(v.value, np.array([9, 11, 7]))
+        assert np.array_equal(v.error, np.array([10, 12, 8]))
+
     @staticmethod
     def test_copy():
         v = VectorUncertainty(np.array([1, 2, 3]), np.array([4, 5, 6]))
@@ -1116,6 +1133,90 @@ class TestVectorUncertainty:
         assert np.array_equal(dup.error, v.error)
         assert id(dup) != id(v)
 
+    @staticmethod
+    @settings(deadline=None)  # The first call compiles the fused kernels.
+    @given(
+        arr1=hnp.arrays(np.float64, (4,), elements=st.floats(**general_float_strategy)),
+        arr2=hnp.arrays(
+            np.float64, (4,), elements=st.floats(min_value=0, max_value=1e3)
+        ),
+        op=st.sampled_from(
+            [operator.add, operator.sub, operator.mul, operator.truediv]
+        ),
+    )
+    def test_stacked_arithmetic(arr1, arr2, op):
+        # Sequence construction uses the stacked (2, N) layout; direct construction does not.
+        stacked = Uncertainty(
+            [Uncertainty(v, e) for v, e in zip(arr1, arr2, strict=True)]
+        )
+        plain = VectorUncertainty(arr1.copy(), arr2.copy())
+        assert stacked._data is not None
+        assert plain._data is None
+
+        # Run the fused kernels on these small arrays, too.
+        with mock.patch.object(_kernels, "KERNEL_MIN_SIZE", 0):
+            result = op(stacked, stacked.copy())
+        expected = op(plain, plain.copy())
+        assert result._data is not None
+        np.testing.assert_allclose(result.value, expected.value)
+        np.testing.assert_allclose(result.error, expected.error)
+
+    @staticmethod
+    @settings(deadline=None)  # The first call compiles the fused kernel.
+    @given(
+        arr1=hnp.arrays(
+            np.float64,
+            (4,),
+            # Keep away from tiny bases, where the reference formula overflows.
+            elements=st.just(0.0)
+            | st.floats(min_value=1e-3, max_value=1e3)
+            | st.floats(min_value=-1e3, max_value=-1e-3),
+        ),
+        arr2=hnp.arrays(
+            np.float64, (4,), elements=st.floats(min_value=0, max_value=1e3)
+        ),
+        p=st.sampled_from([2, -1, 0.5, 3.7, np.float64(-2.5)]),
+    )
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_pow_constant_exponent(arr1, arr2, p):
+        with mock.patch.object(_kernels, "KERNEL_MIN_SIZE", 0):
+            result = VectorUncertainty(arr1, arr2) ** p
+        expected = VectorUncertainty(
+            arr1**p,
+            np.abs(arr1**p)
+            * np.sqrt((p / arr1 * arr2) ** 2 + (np.log(np.abs(arr1)) * 0) ** 2),
+        )
+        np.testing.assert_allclose(result.value, expected.value)
+        # The reference squares the relative error, which underflows for tiny errors.
+        np.testing.assert_allclose(result.error, expected.error, atol=1e-12)
+
+    @staticmethod
+    @settings(deadline=None)  # The first call compiles the fused kernel.
+    @given(
+        arr1=hnp.arrays(
+            np.float64,
+            (4,),
+            elements=st.floats(min_value=-1e300, max_value=1e300, allow_nan=False),
+        ),
+        p=st.sampled_from([2, -1, 0.5, 1, 3.7, np.float64(-2.5)]),
+    )
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_pow_constant_exponent_paths(arr1, p):
+        # The fused kernel and the NumPy path agree, including for tiny and huge bases.
+        u = VectorUncertainty(arr1, np.full(4, 0.1))
+        with mock.patch.object(_kernels, "KERNEL_MIN_SIZE", 0):
+            fused = u**p
+        with mock.patch.object(_kernels, "KERNEL_MIN_SIZE", np.inf):
+            plain = u**p
+        assert fused._data is not None
+        assert plain._data is None
+        np.testing.assert_allclose(fused.value, plain.value, rtol=1e-12)
+        np.testing.assert_allclose(fused.error, plain.error, rtol=1e-12)
+
+        tiny = VectorUncertainty(np.array([1e-200, 1e300]), np.array([0.1, 0.1]))
+        np.testing.assert_allclose((tiny**0.5).error[0], 5e98)
+        np.testing.assert_allclose((tiny**1).error[1], 0.1)
+
     @staticmethod
     def test_flat():
         v = VectorUncertainty(np.array([1, 2, 3]), np.array([4, 5, 6]))
@@ -1123,6 +1224,14 @@ class TestVectorUncertainty:
         for i, item in enumerate(v.flat):
             assert v[i] == item
 
+        # Multidimensional (and stacked) objects are traversed in C order.
+        m = Uncertainty(np.arange(6.0).reshape(2, 3), np.arange(6.0).reshape(2, 3) / 10)
+        for u in (m, m.copy()):
+            items = list(u.flat)
+            assert len(items) == 6
+            assert [i.value for i in items] == list(range(6))
+            np.testing.assert_allclose([i.error for i in items], np.arange(6) / 10)
+
     @staticmethod
     def test_shape_reshape():
         v = VectorUncertainty(
@@ -1173,6 +1282,10 @@ class TestVectorUncertainty:
         with pytest.raises(IndexError):
             _ = v[4]
 
+        assert not v[..., 0].is_vector
+        assert v[1:].is_vector
+        np.testing.assert_array_equal(v[1:].error, arr2[1:])
+
     @staticmethod
     def test_setitem():
         v = VectorUncertainty(np.array([1.0, 2.0, 3.0]), np.array([4.0, 5.0, 6.0]))
@@ -1208,6 +1321,21 @@ class TestVectorUncertainty:
         for item in result:
             assert isinstance(item, Uncertainty)
 
+    @staticmethod
+    def test_tolist_nested():
+        nom = np.arange(24.0).reshape(2, 3, 4)
+        v = VectorUncertainty(nom, nom / 10)
+
+        for u in (v, v.copy()):
+            result = u.tolist()
+            assert len(result) == 2
+            assert len(result[1]) == 3
+            assert len(result[1][2]) == 4
+            item = result[1][2][3]
+            assert isinstance(item, Uncertainty)
+            assert item.value == 23.0
+            assert item.error == pytest.approx(2.3)
+
     @staticmethod
     def test_tolist_edgecase():
         """Contrived test for when tolist is not available."""
@@ -1242,6 +1370,182 @@ class TestVectorUncertainty:
             bytes(digest if digest else "", encoding="utf-8"), "big"
         )
 
+    @staticmethod
+    def test_relative():
+        v = VectorUncertainty(
+            np.array([2.0, 0.0, np.inf, -4.0, np.nan]),
+            np.array([1.0, 1.0, 1.0, 1.0, 1.0]),
+        )
+        np.testing.assert_array_equal(v.relative, [0.5, np.nan, np.inf, 0.25, np.nan])
+
+    @staticmethod
+    def test_cache_invalidation():
+        v = VectorUncertainty(np.array([1.0, 2.0, 4.0]), np.array([0.1, 0.2, 0.4]))
+        digest = hash(v)
+        np.testing.assert_allclose(v.relative, [0.1, 0.1, 0.1])
+
+        v[0] = Uncertainty(8.0, 0.4)
+        np.testing.assert_allclose(v.relative, [0.05, 0.1, 0.1])
+        assert hash(v) != digest
+
+        # Changes through the public arrays are picked up as well.
+        digest = hash(v)
+        v.value[2] = 100.0
+        np.testing.assert_allclose(v.relative, [0.05, 0.1, 0.004])
+        assert hash(v) != digest
+
+        # The relative uncertainty of a vector is a new, writable array.
+        rel = v.relative
+        rel *= 2
+        np.testing.assert_allclose(v.relative, [0.05, 0.1, 0.004])
+
+        s = Uncertainty(2.0, 0.5)
+        assert s.relative is s.relative
+
+    @staticmethod
+    def test_exact_operand():
+        v = VectorUncertainty(np.array([1.0, 2.0, 4.0]), np.array([0.1, 0.2, 0.4]))
+        c = VectorUncertainty(np.array([5.0, 6.0, 7.0]))
+
+        for result in (v + c, c + v, v - c, c - v):
+            np.testing.assert_array_equal(result.error, v.error)
+            assert result._err is not v._err
+
+        # The error has the dtype of the result.
+        f = VectorUncertainty(np.ones(3, np.float32), np.full(3, 0.1, np.float32))
+        for result in (f + c, c - f):
+            assert result.value.dtype == np.float64
+            assert result.error.dtype == np.float64
+
+        # An exact operand that broadcasts to a larger shape.
+        w = VectorUncertainty(np.array([[1.0], [2.0]]), np.array([[0.5], [0.5]]))
+        np.testing.assert_array_equal((w + c).error, np.full((2, 3), 0.5))
+
+        # Modifications through the public error array are picked up.
+        _ = v + c
+        c.error[0] = 0.3
+        np.testing.assert_allclose((v + c).error, [np.hypot(0.1, 0.3), 0.2, 0.4])
+
+        # Scalars, including an exact scalar added to a vector.
+        s = Uncertainty(2.0, 0.5)
+        assert (s + Uncertainty(1.0)).error == 0.5
+        assert (Uncertainty(1.0) - s).error == 0.5
+        np.testing.assert_array_equal((v + Uncertainty(1.0)).error, v.error)
+
+    @staticmethod
+    def test_inplace_aliasing():
+        # Like NumPy arrays, in-place updates are visible through shared arrays.
+        a = VectorUncertainty(np.array([1.0, 2.0, 4.0]), np.array([0.1, 0.2, 0.4]))
+        b = VectorUncertainty(a.value, a.error)
+        b *= 3
+        np.testing.assert_allclose(a.value, [3.0, 6.0, 12.0])
+        np.testing.assert_allclose(a.error, [0.3, 0.6, 1.2])
+
+        m = VectorUncertainty(np.array([1.0, 2.0, 4.0]), np.array([0.1, 0.2, 0.4]))
+        np.testing.assert_allclose(m.relative, [0.1, 0.1, 0.1])
+        row = m[0:2]
+        row += 1.0
+        np.testing.assert_allclose(m.value, [2.0, 3.0, 4.0])
+        np.testing.assert_allclose(m.relative, [0.05, 0.2 / 3, 0.1])
+
+    @staticmethod
+    def test_eq_identity():
+        v = VectorUncertainty(np.array([1.0, 2.0]), np.array([0.1, 0.2]))
+        assert v == v
+        assert v == Uncertainty._unchecked(v._nom, v._err)
+        assert not (v != v)  # noqa: SIM202 (checks __ne__, not __eq__)
+
+        # NaN central values still compare unequal (__ne__ negates __eq__).
+        n = VectorUncertainty(np.array([1.0, np.nan]), np.array([0.1, 0.2]))
+        assert n != n
+
+        s = Uncertainty(1.0, 0.1)
+        assert s == s
+        assert Uncertainty(np.nan, 0.1) != Uncertainty(np.nan, 0.1)
+
+    @staticmethod
+    def test_inplace_scalar_ops():
+        v = VectorUncertainty(np.array([1.0, 2.0, 4.0]), np.array([0.1, 0.2, 0.4]))
+        nom, err = v._nom, v._err
+        w = v + 1.0
+        assert v._is_array
+        np.testing.assert_allclose(v.relative, [0.1, 0.1, 0.1])
+
+        v += 1.0
+        v -= 3.0
+        v *= -2.0
+        v /= 4.0
+
+        # The arrays are updated in place.
+        assert v._nom is nom
+        assert v._err is err
+        np.testing.assert_allclose(v.value, [0.5, 0.0, -1.0])
+        np.testing.assert_allclose(v.error, [0.05, 0.1, 0.2])
+        np.testing.assert_allclose(v.relative, [0.1, np.nan, 0.2])
+
+        # Results of earlier operations do not share their errors with v.
+        np.testing.assert_allclose(w.error, [0.1, 0.2, 0.4])
+
+        # Everything else falls back to the regular operators.
+        v /= 0.0
+        assert v._nom is not nom
+        np.testing.assert_array_equal(v.error, [0, 0, 0])
+
+        # Read-only arrays are not modified; the name is rebound to a new object.
+        ro = np.array([1.0, 2.0])
+        ro.flags.writeable = False
+        r = VectorUncertainty(ro, np.array([0.1, 0.2]))
+        r_orig = r
+        r += 1.0
+        r *= 2.0
+        assert r is not r_orig
+        np.testing.assert_array_equal(ro, [1.0, 2.0])
+        np.testing.assert_allclose(r.value, [4.0, 6.0])
+        np.testing.assert_allclose(r.error, [0.2, 0.4])
+
+        s = Uncertainty(2.0, 0.5)
+        assert not s._is_array
+        s *= 2
+        assert s == Uncertainty(4.0, 1.0)
+
+    @staticmethod
+    def test_inplace_shared_memory():
+        # Value and error are the same array; updating one must not change the other.
+        a = np.array([1.0, 2.0])
+        u = Uncertainty(a, a)
+        u *= 2
+        np.testing.assert_array_equal(u.value, [2.0, 4.0])
+        np.testing.assert_array_equal(u.error, [2.0, 4.0])
+        u += 1
+        np.testing.assert_array_equal(u.value, [3.0, 5.0])
+        np.testing.assert_array_equal(u.error, [2.0, 4.0])
+
+        b = np.array([1.0, 2.0, 3.0])
+        u = Uncertainty(b[1:], b[:-1])
+        u -= 1
+        np.testing.assert_array_equal(u.value, [1.0, 2.0])
+        np.testing.assert_array_equal(u.error, [1.0, 2.0])
+
+    @staticmethod
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_inplace_nonfinite_errors():
+        # Errors that overflow are set to zero, as with the regular operators.
+        def make():
+            return Uncertainty(np.array([1.0, 2.0]), np.array([1.0, 2.0]))
+
+        for c in (1e308, 1e-310):
+            u = make()
+            u *= c
+            np.testing.assert_array_equal(u.value, (make() * c).value)
+            np.testing.assert_array_equal(u.error, (make() * c).error)
+            u = make()
+            u /= c
+            np.testing.assert_array_equal(u.value, (make() / c).value)
+            np.testing.assert_array_equal(u.error, (make() / c).error)
+        u = make()
+        u /= 1e-310
+        np.testing.assert_array_equal(u.error, [0.0, 0.0])
+
     def test_unimplemented_methods(self):
         v = Uncertainty(np.array([1, 2, 3]))
 